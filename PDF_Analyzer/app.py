@@ -1,18 +1,11 @@
 import streamlit as st
 import json
-import tempfile
-import os
 from datetime import datetime
+from functools import lru_cache
 from pdf_checker import analyze_pdf
 
-st.set_page_config(
-    page_title="PDF Compliance Analyzer",
-    page_icon="📋",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
 
-st.markdown("""
+CSS = """
 <style>
     .main-header {
         text-align: center;
@@ -64,14 +57,123 @@ st.markdown("""
         margin: 0.5rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-st.markdown("""
+HEADER_HTML = """
 <div class="main-header">
     <h1>📋 PDF Compliance Analyzer</h1>
     <p>Professional Document Analysis & Validation Tool</p>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+PRESET_LIMITS_JSON = {
+    "Resume Template": json.dumps({
+        "skills": 2,
+        "experience": 3,
+        "education": 1,
+        "summary": 1
+    }, indent=2),
+    "Report Template": json.dumps({
+        "executive_summary": 2,
+        "methodology": 3,
+        "results": 5,
+        "appendix": 10
+    }, indent=2),
+}
+
+
+@lru_cache(maxsize=512)
+def _pretty(key):
+    """Turn a report key like ``font_size`` into a display label."""
+    return key.replace('_', ' ').title()
+
+
+@st.cache_data(show_spinner=False)
+def _status_card(name, size_mb, mime):
+    """Render the uploaded-file information card."""
+    return f"""
+        <div class="status-card">
+            <strong>📄 File Information</strong><br>
+            <strong>Name:</strong> {name}<br>
+            <strong>Size:</strong> {size_mb:.2f} MB<br>
+            <strong>Type:</strong> {mime}
+        </div>
+        """
+
+
+@st.cache_data(show_spinner=False)
+def _parse_limits(text):
+    """Parse the section limits JSON; unchanged text is served from cache."""
+    return json.loads(text)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_analyze(file_bytes, limits_key, do_format=True, do_sections=True):
+    """Analyze PDF bytes, memoized on file content, section limits and enabled checks."""
+    return analyze_pdf(
+        file_bytes,
+        max_page_limits=json.loads(limits_key),
+        do_format=do_format,
+        do_sections=do_sections
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _to_json(result):
+    """Serialize the report for the JSON download."""
+    return json.dumps(result, indent=2, ensure_ascii=False)
+
+
+@st.cache_data(show_spinner=False)
+def _to_summary(result, meta):
+    """Build the body of the plain-text summary report (everything after the timestamp)."""
+    name, size_mb, depth, metadata, structure, compliance = meta
+    return f"""File: {name}
+Size: {size_mb:.2f} MB
+
+Analysis Configuration:
+- Depth: {depth}
+- Metadata Analysis: {'Enabled' if metadata else 'Disabled'}
+- Structure Analysis: {'Enabled' if structure else 'Disabled'}
+- Compliance Check: {'Enabled' if compliance else 'Disabled'}
+
+Results Summary:
+{json.dumps(result, indent=2)}
+"""
+
+
+@st.cache_data(show_spinner=False)
+def _summarize(result):
+    """Count passed checks and collect failed ones, split by report section, in one pass."""
+    passes = 0
+    failures = []
+    format_fails = []
+    content_fails = []
+    for section, checks in result.items():
+        if not isinstance(checks, dict):
+            continue
+        bucket = format_fails if section == "format" else content_fails if section == "content" else None
+        for key, value in checks.items():
+            if value == "pass":
+                passes += 1
+            elif value == "fail":
+                name = _pretty(key)
+                failures.append(name)
+                if bucket is not None:
+                    bucket.append(name)
+    return passes, failures, format_fails, content_fails
+
+
+st.set_page_config(
+    page_title="PDF Compliance Analyzer",
+    page_icon="📋",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+st.markdown(CSS, unsafe_allow_html=True)
+
+st.markdown(HEADER_HTML, unsafe_allow_html=True)
 
 with st.sidebar:
     st.header("⚙️ Configuration")
@@ -102,22 +204,7 @@ with st.sidebar:
             help="Select a preset or create custom limits"
         )
         
-        if preset_limits == "Resume Template":
-            custom_limits_json = json.dumps({
-                "skills": 2,
-                "experience": 3,
-                "education": 1,
-                "summary": 1
-            }, indent=2)
-        elif preset_limits == "Report Template":
-            custom_limits_json = json.dumps({
-                "executive_summary": 2,
-                "methodology": 3,
-                "results": 5,
-                "appendix": 10
-            }, indent=2)
-        else:
-            custom_limits_json = ""
+        custom_limits_json = PRESET_LIMITS_JSON.get(preset_limits, "")
         
         custom_limits = st.text_area(
             "JSON Section Limits",
@@ -133,7 +220,7 @@ with st.sidebar:
     json_valid = True
     if custom_limits.strip() and use_custom_limits:
         try:
-            max_page_limits = json.loads(custom_limits)
+            max_page_limits = _parse_limits(custom_limits)
             st.success(f"✅ Valid JSON ({len(max_page_limits)} sections)")
         except json.JSONDecodeError as e:
             st.error(f"❌ Invalid JSON: {str(e)}")
@@ -155,14 +242,7 @@ with col1:
     if uploaded_file:
         # Display file information
         file_size = len(uploaded_file.getvalue()) / (1024 * 1024)  # MB
-        st.markdown(f"""
-        <div class="status-card">
-            <strong>📄 File Information</strong><br>
-            <strong>Name:</strong> {uploaded_file.name}<br>
-            <strong>Size:</strong> {file_size:.2f} MB<br>
-            <strong>Type:</strong> {uploaded_file.type}
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_status_card(uploaded_file.name, file_size, uploaded_file.type), unsafe_allow_html=True)
 
 with col2:
     st.subheader("📊 Analysis Summary")
@@ -203,9 +283,7 @@ if uploaded_file:
         )
     
     if analyze_button:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-            tmp_file.write(uploaded_file.read())
-            temp_pdf_path = tmp_file.name
+        limits_key = json.dumps(max_page_limits, sort_keys=True)
         
         progress_bar = st.progress(0)
         status_text = st.empty()
@@ -221,16 +299,16 @@ if uploaded_file:
             progress_bar.progress(60)
             
             with st.spinner("Analyzing PDF content..."):
-                result = analyze_pdf(temp_pdf_path, max_page_limits=max_page_limits)
+                result = _cached_analyze(
+                    uploaded_file.getvalue(),
+                    limits_key,
+                    do_format=include_metadata or include_compliance,
+                    do_sections=include_structure or include_compliance
+                )
             
             status_text.text("✅ Analysis completed successfully!")
             progress_bar.progress(100)
             
-            try:
-                os.unlink(temp_pdf_path)
-            except:
-                pass
-            
             st.subheader("📋 Analysis Results")
             
             tab1, tab2, tab3 = st.tabs(["📊 Summary", "📄 Detailed Report", "💾 Export"])
@@ -241,30 +319,8 @@ if uploaded_file:
                     
                     total_pages = result.get('total_pages', 'N/A')
                     
-                    def count_failures(data):
-                        failures = []
-                        if isinstance(data, dict):
-                            for key, value in data.items():
-                                if value == "fail":
-                                    failures.append(key.replace('_', ' ').title())
-                                elif isinstance(value, dict):
-                                    failures.extend(count_failures(value))
-                        return failures
-                    
-                    failed_items = count_failures(result)
+                    passed_items, failed_items, format_fails, content_fails = _summarize(result)
                     issues_found = len(failed_items)
-                    
-                    def count_passes(data):
-                        passes = 0
-                        if isinstance(data, dict):
-                            for key, value in data.items():
-                                if value == "pass":
-                                    passes += 1
-                                elif isinstance(value, dict):
-                                    passes += count_passes(value)
-                        return passes
-                    
-                    passed_items = count_passes(result)
                     total_checks = issues_found + passed_items
                     compliance_score = round((passed_items / total_checks * 100), 1) if total_checks > 0 else 'N/A'
                     
@@ -280,20 +336,6 @@ if uploaded_file:
                 if failed_items:
                     st.warning(f"⚠️ Found {len(failed_items)} compliance issues requiring attention:")
                     
-                    format_fails = []
-                    content_fails = []
-                    other_fails = []
-                    
-                    if 'format' in result and isinstance(result['format'], dict):
-                        for key, value in result['format'].items():
-                            if value == "fail":
-                                format_fails.append(key.replace('_', ' ').title())
-                    
-                    if 'content' in result and isinstance(result['content'], dict):
-                        for key, value in result['content'].items():
-                            if isinstance(value, str) and value == "fail":
-                                content_fails.append(key.replace('_', ' ').title())
-                    
                     if format_fails:
                         st.error("📝 **Format Issues:**")
                         for item in format_fails[:5]:
@@ -325,7 +367,7 @@ if uploaded_file:
                             if isinstance(format_data, dict):
                                 col1, col2 = st.columns(2)
                                 for i, (key, value) in enumerate(format_data.items()):
-                                    display_name = key.replace('_', ' ').title()
+                                    display_name = _pretty(key)
                                     status_icon = "✅" if value == "pass" else "❌" if value == "fail" else "ℹ️"
                                     status_color = "success" if value == "pass" else "error" if value == "fail" else "info"
                                     
@@ -345,7 +387,7 @@ if uploaded_file:
                             content_data = result['content']
                             if isinstance(content_data, dict):
                                 for key, value in content_data.items():
-                                    display_name = key.replace('_', ' ').title()
+                                    display_name = _pretty(key)
                                     if key.endswith('_pages'):
                                         st.metric(f"{display_name}", value)
                                     else:
@@ -361,7 +403,7 @@ if uploaded_file:
                     
                     for key, value in result.items():
                         if key not in ['format', 'content']:
-                            with st.expander(f"📑 {key.replace('_', ' ').title()}", expanded=False):
+                            with st.expander(f"📑 {_pretty(key)}", expanded=False):
                                 if isinstance(value, (dict, list)):
                                     st.json(value)
                                 else:
@@ -376,7 +418,7 @@ if uploaded_file:
                 col_export1, col_export2 = st.columns(2)
                 
                 with col_export1:
-                    json_str = json.dumps(result, indent=2, ensure_ascii=False)
+                    json_str = _to_json(result)
                     st.download_button(
                         "📄 Download JSON Report",
                         json_str,
@@ -386,20 +428,19 @@ if uploaded_file:
                     )
                 
                 with col_export2:
-                    summary_text = f"""PDF Compliance Analysis Report
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-File: {uploaded_file.name}
-Size: {file_size:.2f} MB
-
-Analysis Configuration:
-- Depth: {analysis_depth}
-- Metadata Analysis: {'Enabled' if include_metadata else 'Disabled'}
-- Structure Analysis: {'Enabled' if include_structure else 'Disabled'}
-- Compliance Check: {'Enabled' if include_compliance else 'Disabled'}
-
-Results Summary:
-{json.dumps(result, indent=2)}
-"""
+                    summary_meta = (
+                        uploaded_file.name,
+                        file_size,
+                        analysis_depth,
+                        include_metadata,
+                        include_structure,
+                        include_compliance,
+                    )
+                    summary_text = (
+                        "PDF Compliance Analysis Report\n"
+                        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                        + _to_summary(result, summary_meta)
+                    )
                     st.download_button(
                         "📝 Download Summary Report",
                         summary_text,
@@ -410,10 +451,6 @@ Results Summary:
         
         except Exception as e:
             st.error(f"❌ Analysis failed: {str(e)}")
-            try:
-                os.unlink(temp_pdf_path)
-            except:
-                pass
         
         finally:
             progress_bar.empty()
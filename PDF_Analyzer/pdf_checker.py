@@ -1,22 +1,35 @@
 from pathlib import Path
 import fitz  
-import pdfplumber
 import json
+import os
 import re
-from collections import defaultdict
-from PyPDF2 import PdfReader
+from concurrent.futures import ProcessPoolExecutor
 
+# Worker startup plus reopening the PDF costs ~35-45ms; below this many pages the
+# sequential loop finishes first even with 4 workers
+PARALLEL_MIN_PAGES = 128
+MAX_WORKERS = 4
 
-def is_valid_pdf(file_path):
-    """Check if the provided file is a valid PDF."""
-    try:
-        PdfReader(file_path)
-        return True
-    except:
-        return False
+_CLEAN_RE = re.compile(r"[^a-z ]")
 
 
-def check_formatting(pdf_path):
+def _scan_fonts(page):
+    """Return (has 12pt text, has Times text), stopping at the first span satisfying both."""
+    size_ok = False
+    font_ok = False
+    for block in page.get_text("dict")["blocks"]:
+        for line in block.get("lines", []):
+            for span in line["spans"]:
+                if not size_ok and round(span["size"], 1) == 12.0:
+                    size_ok = True
+                if not font_ok and "Times" in span["font"]:
+                    font_ok = True
+                if size_ok and font_ok:
+                    return size_ok, font_ok
+    return size_ok, font_ok
+
+
+def check_formatting(doc):
     """Check font size, font family, and margins on the first page of the PDF."""
     result = {
         "font_size": "pass",
@@ -24,91 +37,162 @@ def check_formatting(pdf_path):
         "margin": "pass"
     }
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            page = pdf.pages[0]
-            fonts = set()
-            sizes = set()
+        page = doc.load_page(0)
+        size_ok, font_ok = _scan_fonts(page)
 
-            for char in page.chars:
-                fonts.add(char.get('fontname', ''))
-                sizes.add(round(float(char.get('size', 0)), 1))
+        if not size_ok:
+            result['font_size'] = 'fail'
+        if not font_ok:
+            result['font_family'] = 'fail'
 
-            if 12.0 not in sizes:
-                result['font_size'] = 'fail'
-            if not any("Times" in f or "TimesNewRoman" in f for f in fonts):
-                result['font_family'] = 'fail'
+        width = page.rect.width
+        height = page.rect.height
 
-            width = page.width
-            height = page.height
-            content = page.bbox
+        x0 = y0 = float("inf")
+        x1 = y1 = float("-inf")
+        for bx0, by0, bx1, by1, *_ in page.get_text("blocks"):
+            x0 = min(x0, bx0)
+            y0 = min(y0, by0)
+            x1 = max(x1, bx1)
+            y1 = max(y1, by1)
 
-            left = content[0]
-            right = width - content[2]
-            top = height - content[3]
-            bottom = content[1]
+        left = x0
+        right = width - x1
+        top = y0
+        bottom = height - y1
 
-            one_inch = 72  
-            tolerance = 5  
+        one_inch = 72  
+        tolerance = 5  
 
-            if not all(abs(m - one_inch) <= tolerance for m in [left, right, top, bottom]):
-                result['margin'] = 'fail'
+        if not all(abs(m - one_inch) <= tolerance for m in [left, right, top, bottom]):
+            result['margin'] = 'fail'
 
     except:
         result = {k: 'fail' for k in result}
     return result
 
 
-def detect_sections_dynamic(pdf_path, max_page_limits=None):
+def _is_section_header(line):
+    """Return True for all-caps headings ("SKILLS") or "Title Case:" headings."""
+    if not line.isascii():
+        return False
+    if line.isupper() and 2 <= len(line) <= 40:
+        return True
+    return (
+        line.endswith(":")
+        and line[0].isupper()
+        and line[:-1].replace(" ", "").replace("-", "").isalpha()
+    )
+
+
+def _open_pdf(source):
+    """Open a PDF from a file path or from raw bytes."""
+    if isinstance(source, (bytes, bytearray)):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+
+_worker_doc = None
+
+
+def _init_worker(source):
+    """Open the document once per worker process."""
+    global _worker_doc
+    _worker_doc = _open_pdf(source)
+
+
+def _extract_page_text(page_number):
+    """Extract plain text from a single page (runs in a worker process)."""
+    return _worker_doc.get_page_text(page_number)
+
+
+def extract_page_texts(doc, source=None):
+    """Extract plain text for every page, fanning out to worker processes for long documents.
+
+    ``source`` is the path or bytes ``doc`` was opened from; workers reopen it
+    since fitz documents cannot be pickled.
+    """
+    n = doc.page_count
+    source = source or doc.name
+    workers = min(os.cpu_count() or 1, MAX_WORKERS)
+    if workers <= 1 or n < PARALLEL_MIN_PAGES or not source:
+        return [doc.get_page_text(i) for i in range(n)]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(source,),
+    ) as executor:
+        return list(executor.map(_extract_page_text, range(n), chunksize=4))
+
+
+def detect_sections_dynamic(doc, max_page_limits=None, source=None):
     """Detect section names dynamically and count how many pages each spans."""
-    doc = fitz.open(pdf_path)
     section_starts = {}
-    section_pages = defaultdict(list)
+    section_counts = {}
+    last_section = None
+    last_page = None
+    clean_name = _CLEAN_RE.sub
 
-    for i, page in enumerate(doc):
-        text = page.get_text("text")
+    for i, text in enumerate(extract_page_texts(doc, source)):
         lines = text.split("\n")
 
         for line in lines:
-            line_clean = line.strip().lower()
-            if re.match(r"^[A-Z][A-Za-z\s\-]+:$", line.strip()) or line.isupper():
-                section_name = re.sub(r"[^a-z ]", "", line_clean).strip()
+            line = line.strip()
+            # Cheap inline gate so ordinary prose lines skip the function call.
+            if line and (line[-1] == ":" or line.isupper()) and _is_section_header(line):
+                section_name = clean_name("", line.lower()).strip()
                 if section_name and section_name not in section_starts:
                     section_starts[section_name] = i
-                    section_pages[section_name].append(i)
-            elif section_starts:
-                last_section = list(section_starts.keys())[-1]
-                section_pages[last_section].append(i)
-
-    for k in section_pages:
-        section_pages[k] = sorted(set(section_pages[k]))
+                    section_counts[section_name] = 1
+                    last_section = section_name
+                    last_page = i
+            elif last_section is not None and i != last_page:
+                section_counts[last_section] += 1
+                last_page = i
 
     result = {}
-    for sec, pages in section_pages.items():
-        page_key = f"{sec.replace(' ', '_')}_pages"
+    for sec, page_count in section_counts.items():
         status_key = sec.replace(' ', '_')
+        page_key = f"{status_key}_pages"
 
-        result[page_key] = len(pages)
+        result[page_key] = page_count
 
         if max_page_limits and sec in max_page_limits:
-            result[status_key] = "pass" if len(pages) <= max_page_limits[sec] else "fail"
+            result[status_key] = "pass" if page_count <= max_page_limits[sec] else "fail"
         else:
             result[status_key] = "n/a"  
 
     return result
 
 
-def analyze_pdf(pdf_path, max_page_limits=None):
-    """Run full analysis: format + content section validation."""
+def analyze_pdf(source, max_page_limits=None, *, do_format=True, do_sections=True):
+    """Run full analysis: format + content section validation.
+
+    ``source`` is either a path to the PDF or its raw bytes. ``do_format`` and
+    ``do_sections`` allow skipping the formatting or section checks.
+    """
     report = {
         "format": {},
         "content": {}
     }
 
-    if not is_valid_pdf(pdf_path):
+    try:
+        doc = _open_pdf(source)
+    except:
         report["format"]["file_type"] = "fail"
         return report
 
-    report["format"]["file_type"] = "pass"
-    report["format"].update(check_formatting(pdf_path))
-    report["content"].update(detect_sections_dynamic(pdf_path, max_page_limits))
-    return report
+    try:
+        if not doc.is_pdf:
+            report["format"]["file_type"] = "fail"
+            return report
+
+        report["format"]["file_type"] = "pass"
+        if do_format:
+            report["format"].update(check_formatting(doc))
+        if do_sections:
+            report["content"].update(detect_sections_dynamic(doc, max_page_limits, source))
+    finally:
+        doc.close()
+    return report
\ No newline at end of file
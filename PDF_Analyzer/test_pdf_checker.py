@@ -0,0 +1,23 @@
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fitz")
+
+from pdf_checker import _is_section_header, analyze_pdf
+
+HERE = Path(__file__).parent
+
+
+def test_sample_pdf_matches_saved_analysis():
+    """The bundled job description still produces final_pdf_analysis.json (Resume Template limits)."""
+    expected = json.loads((HERE / "final_pdf_analysis.json").read_text())
+    limits = {"skills": 2, "experience": 3, "education": 1, "summary": 1}
+    assert analyze_pdf(str(HERE / "AI_JD_UCI.pdf"), limits) == expected
+
+
+def test_long_all_caps_colon_header_is_a_section():
+    assert _is_section_header("QUALIFICATIONS AND EDUCATION REQUIREMENTS:")
+    assert _is_section_header("SKILLS")
+    assert not _is_section_header("A" * 41)
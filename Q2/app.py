@@ -1,12 +1,15 @@
 # ===== streamlit_app.py =====
 import streamlit as st
 import asyncio
-import json
+import hashlib
+import orjson
 from datetime import datetime
-from typing import Dict, List
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List
+
+# plotly, pandas and numpy are imported lazily where charts/tables are built,
+# so the input tab doesn't pay for them on cold start
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 # Import our core classes (assuming they're in social_media_generator.py)
 from social_post_generator import (
@@ -17,49 +20,9 @@ from social_post_generator import (
     BlogAnalysis
 )
 
-# Page configuration
-st.set_page_config(
-    page_title="Social Media Content Generator",
-    page_icon="📱",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Custom CSS for better styling
-st.markdown("""
+# Static styling, built once at import
+CSS = """
 <style>
-    .main-header {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        padding: 2rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    
-    .platform-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border: 2px solid #f0f0f0;
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    
-    .platform-card:hover {
-        border-color: #667eea;
-        transform: translateY(-2px);
-        transition: all 0.3s ease;
-    }
-    
-    .metric-card {
-        background: #f8f9fa;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #667eea;
-        margin: 0.5rem 0;
-    }
-    
     .success-message {
         background: #d4edda;
         color: #155724;
@@ -111,37 +74,111 @@ st.markdown("""
         margin-bottom: 0.5rem;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Page configuration
+st.set_page_config(
+    page_title="Social Media Content Generator",
+    page_icon="📱",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS for better styling (st.html skips the markdown renderer)
+st.html(CSS)
 
 # Initialize session state
-if 'generator' not in st.session_state:
-    st.session_state.generator = SocialMediaGenerator()
 if 'generated_posts' not in st.session_state:
     st.session_state.generated_posts = {}
 if 'blog_analysis' not in st.session_state:
     st.session_state.blog_analysis = None
 
-def get_platform_icon(platform: str) -> str:
-    """Get emoji icon for each platform"""
-    icons = {
-        'twitter': '🐦',
-        'linkedin': '💼',
-        'instagram': '📸',
-        'facebook': '📘',
-        'tiktok': '🎵'
-    }
-    return icons.get(platform, '📱')
-
-def get_platform_color(platform: str) -> str:
-    """Get color for each platform"""
-    colors = {
-        'twitter': '#1DA1F2',
-        'linkedin': '#0077B5',
-        'instagram': '#E4405F',
-        'facebook': '#1877F2',
-        'tiktok': '#000000'
-    }
-    return colors.get(platform, '#667eea')
+PLATFORM_ICONS = {
+    'twitter': '🐦',
+    'linkedin': '💼',
+    'instagram': '📸',
+    'facebook': '📘',
+    'tiktok': '🎵'
+}
+
+PLATFORM_COLORS = {
+    'twitter': '#1DA1F2',
+    'linkedin': '#0077B5',
+    'instagram': '#E4405F',
+    'facebook': '#1877F2',
+    'tiktok': '#000000'
+}
+
+ENGAGEMENT_ICONS = {
+    "Very High": "🟢",
+    "High": "🔵",
+    "Medium": "🟡",
+    "Low": "🔴"
+}
+
+# Engagement levels are strings; rank them explicitly rather than comparing lexicographically
+ENGAGEMENT_RANK = {"Low": 0, "Medium": 1, "High": 2, "Very High": 3}
+
+SAMPLE_CONTENT = """# The Future of Remote Work: 5 Trends Reshaping the Workplace
+
+The pandemic accelerated remote work adoption, but what we're seeing now goes far beyond emergency measures. Companies and employees alike are reimagining what work means in the digital age.
+
+## 1. Hybrid Models Become the Norm
+Organizations are discovering that flexibility isn't just a perk—it's a competitive advantage. The best talent expects options, and companies that offer them are winning the recruitment game.
+
+## 2. Digital-First Company Culture
+Remote-first companies are building stronger cultures than ever by being intentional about connection. Virtual coffee chats, online team building, and digital collaboration tools are creating bonds that transcend physical spaces.
+
+## 3. Results-Oriented Performance Metrics
+The shift from hours worked to outcomes achieved is revolutionizing how we measure success. Companies are focusing on deliverables, impact, and innovation rather than desk time.
+
+## 4. Investment in Home Office Infrastructure
+Employers are recognizing that a productive remote workforce requires proper tools. From ergonomic chairs to high-speed internet stipends, companies are investing in their distributed teams.
+
+## 5. Mental Health and Work-Life Balance Priority
+The conversation around burnout has reached a tipping point. Organizations are implementing wellness programs, mental health days, and boundaries that actually protect personal time.
+
+The future of work isn't about choosing between remote and in-office—it's about creating systems that empower people to do their best work wherever they are."""
+
+@st.cache_resource
+def get_platform_manager() -> PlatformManager:
+    """Shared, read-only platform configuration"""
+    return PlatformManager()
+
+@st.cache_data(show_spinner=False)
+def content_stats(text: str) -> tuple:
+    """Word, character and non-empty line counts for the input article"""
+    return len(text.split()), len(text), sum(1 for line in text.splitlines() if line.strip())
+
+@st.cache_data(show_spinner=False)
+def analyze_blog(blog_content: str) -> BlogAnalysis:
+    """Analyze blog content, cached on the article text"""
+    return ContentAnalyzer().analyze_blog_content(blog_content)
+
+def api_key_fingerprint(api_key: str) -> str:
+    """Non-reversible identifier for the API key, so the raw key is never compared or logged"""
+    return hashlib.sha256(api_key.encode()).hexdigest() if api_key else ""
+
+def get_generator(api_key: str) -> SocialMediaGenerator:
+    """This session's generator, rebuilt only when the API key changes so its caches survive reruns"""
+    key_fp = api_key_fingerprint(api_key)
+    if st.session_state.get('generator_key_fp') != key_fp or 'generator' not in st.session_state:
+        st.session_state.generator = SocialMediaGenerator(api_key or None)
+        st.session_state.generator_key_fp = key_fp
+    return st.session_state.generator
+
+async def stream_posts(generator: SocialMediaGenerator, blog_content: str,
+                       platforms: List[str]) -> Dict[str, GeneratedPost]:
+    """Report each platform as soon as its post is ready, then return all posts in selection order"""
+    posts = {}
+    try:
+        async for platform, post in generator.stream_posts(blog_content, platforms):
+            st.write(f"{PLATFORM_ICONS.get(platform, '📱')} {platform.title()} post ready")
+            posts[platform] = post
+    finally:
+        # The HTTP client's connections belong to this asyncio.run loop; release them before it closes
+        await generator.aclose()
+    return {p: posts[p] for p in platforms if p in posts}
 
 def display_content_analysis(analysis: BlogAnalysis):
     """Display blog content analysis"""
@@ -150,188 +187,164 @@ def display_content_analysis(analysis: BlogAnalysis):
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h4>📝 Article Details</h4>
-            <p><strong>Title:</strong> {analysis.title}</p>
-            <p><strong>Word Count:</strong> {analysis.word_count:,}</p>
-            <p><strong>Tone:</strong> {analysis.tone.title()}</p>
-            <p><strong>Target Audience:</strong> {analysis.target_audience.title()}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        with st.container(border=True):
+            st.markdown("#### 📝 Article Details")
+            st.write(f"**Title:** {analysis.title}")
+            st.write(f"**Word Count:** {analysis.word_count:,}")
+            st.write(f"**Tone:** {analysis.tone.title()}")
+            st.write(f"**Target Audience:** {analysis.target_audience.title()}")
     
     with col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h4>🎯 Key Topics</h4>
-            <p>{', '.join(analysis.main_topics) if analysis.main_topics else 'General content'}</p>
-            <h4>📌 Key Points</h4>
-            <ul>
-                {''.join([f'<li>{point}</li>' for point in analysis.key_points[:3]])}
-            </ul>
-        </div>
-        """, unsafe_allow_html=True)
+        with st.container(border=True):
+            st.markdown("#### 🎯 Key Topics")
+            st.write(', '.join(analysis.main_topics) if analysis.main_topics else 'General content')
+            st.markdown("#### 📌 Key Points")
+            for point in analysis.key_points[:3]:
+                st.write(f"- {point}")
 
+@st.fragment
 def display_platform_post(platform: str, post: GeneratedPost):
-    """Display a generated post for a specific platform"""
-    icon = get_platform_icon(platform)
-    color = get_platform_color(platform)
-    
-    st.markdown(f"""
-    <div class="platform-card">
-        <div style="display: flex; justify-content: between; align-items: center; margin-bottom: 1rem;">
-            <h3 style="color: {color}; margin: 0;">
-                {icon} {platform.title().replace('Tiktok', 'TikTok')}
-            </h3>
-            <div style="flex-grow: 1;"></div>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    # Content
-    st.markdown("**Generated Content:**")
-    st.text_area(
-        f"Content for {platform}",
-        value=post.content,
-        height=150,
-        key=f"content_{platform}",
-        label_visibility="collapsed"
-    )
-    
-    # Copy button
-    if st.button(f"📋 Copy {platform.title()} Post", key=f"copy_{platform}"):
-        st.write("📋 Content copied to clipboard!")  # Note: Actual clipboard copy needs JS
-        st.code(post.content)
-    
-    # Metrics
-    col1, col2, col3, col4 = st.columns(4)
+    """Display a generated post for a specific platform.
+
+    Runs as a fragment so the card's Copy button reruns only this card.
+    """
+    icon = PLATFORM_ICONS.get(platform, '📱')
     
-    with col1:
-        st.metric("Characters", post.metrics.character_count)
-    with col2:
-        st.metric("Words", post.metrics.word_count)
-    with col3:
-        st.metric("Hashtags", post.metrics.hashtag_count)
-    with col4:
+    with st.container(border=True):
+        st.subheader(f"{icon} {platform.title().replace('Tiktok', 'TikTok')}")
+        
+        # Content
+        st.markdown("**Generated Content:**")
+        st.text_area(
+            f"Content for {platform}",
+            value=post.content,
+            height=150,
+            key=f"content_{platform}",
+            label_visibility="collapsed"
+        )
+        
+        # Copy button
+        if st.button(f"📋 Copy {platform.title()} Post", key=f"copy_{platform}"):
+            st.write("📋 Content copied to clipboard!")  # Note: Actual clipboard copy needs JS
+            st.code(post.content)
+        
+        # Metrics (one table row instead of four metric widgets)
         compliance_icon = "✅" if post.metrics.platform_compliance else "❌"
-        st.metric("Compliant", compliance_icon)
-    
-    # Engagement potential
-    engagement_colors = {
-        "Very High": "🟢",
-        "High": "🔵", 
-        "Medium": "🟡",
-        "Low": "🔴"
-    }
-    engagement_icon = engagement_colors.get(post.metrics.engagement_potential, "⚪")
-    
-    st.markdown(f"""
-    <div style="margin: 1rem 0;">
-        <strong>Engagement Potential:</strong> 
-        {engagement_icon} {post.metrics.engagement_potential}
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Additional metrics
-    if post.metrics.additional_metrics:
-        st.markdown("**Platform-Specific Metrics:**")
-        metrics_df = pd.DataFrame([post.metrics.additional_metrics]).T
-        metrics_df.columns = ['Value']
-        st.dataframe(metrics_df, use_container_width=True)
-    
-    st.markdown("</div>", unsafe_allow_html=True)
+        st.dataframe(
+            {
+                "Characters": [post.metrics.character_count],
+                "Words": [post.metrics.word_count],
+                "Hashtags": [post.metrics.hashtag_count],
+                "Compliant": [compliance_icon]
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+        
+        # Engagement potential
+        engagement_icon = ENGAGEMENT_ICONS.get(post.metrics.engagement_potential, "⚪")
+        
+        st.write(f"**Engagement Potential:** {engagement_icon} {post.metrics.engagement_potential}")
+        
+        # Additional metrics
+        if post.metrics.additional_metrics:
+            st.markdown("**Platform-Specific Metrics:**")
+            additional = post.metrics.additional_metrics
+            st.dataframe(
+                {"Metric": list(additional.keys()), "Value": list(additional.values())},
+                hide_index=True,
+                use_container_width=True
+            )
+
+# The bar charts are read-only, so skip Plotly.js interaction wiring
+STATIC_CHART_CONFIG = {"staticPlot": True}
+
+def bar_figure(platforms: tuple, counts: tuple, colors: tuple, title: str, yaxis_title: str) -> "go.Figure":
+    """Build a per-platform bar chart"""
+    import numpy as np
+    import plotly.graph_objects as go
+    
+    # int32 arrays are base64-encoded by Plotly instead of serialized as JSON lists
+    y = np.asarray(counts, dtype=np.int32)
+    fig = go.Figure(data=[
+        go.Bar(
+            x=platforms,
+            y=y,
+            marker_color=colors,
+            text=y,
+            textposition='auto',
+        )
+    ])
+    fig.update_layout(
+        title=title,
+        xaxis_title="Platform",
+        yaxis_title=yaxis_title,
+        showlegend=False,
+        uirevision="posts"
+    )
+    return fig
+
+def engagement_figure(engagement_scores: tuple) -> "go.Figure":
+    """Build the engagement potential pie chart"""
+    import pandas as pd
+    import plotly.express as px
+    
+    engagement_counts = pd.Series(engagement_scores).value_counts()
+    fig = px.pie(
+        values=engagement_counts.values,
+        names=engagement_counts.index,
+        title="Engagement Potential Distribution"
+    )
+    fig.update_layout(uirevision="posts")
+    return fig
 
 def create_analytics_dashboard(posts: Dict[str, GeneratedPost]):
     """Create analytics dashboard for generated posts"""
     st.subheader("📊 Analytics Dashboard")
     
     # Prepare data
-    platforms = list(posts.keys())
-    char_counts = [posts[p].metrics.character_count for p in platforms]
-    word_counts = [posts[p].metrics.word_count for p in platforms]
-    hashtag_counts = [posts[p].metrics.hashtag_count for p in platforms]
-    engagement_scores = [posts[p].metrics.engagement_potential for p in platforms]
+    platforms = tuple(posts.keys())
+    colors = tuple(PLATFORM_COLORS.get(p, '#667eea') for p in platforms)
+    char_counts = tuple(posts[p].metrics.character_count for p in platforms)
+    word_counts = tuple(posts[p].metrics.word_count for p in platforms)
+    hashtag_counts = tuple(posts[p].metrics.hashtag_count for p in platforms)
+    engagement_scores = tuple(posts[p].metrics.engagement_potential for p in platforms)
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Character count comparison
-        fig_chars = go.Figure(data=[
-            go.Bar(
-                x=platforms,
-                y=char_counts,
-                marker_color=[get_platform_color(p) for p in platforms],
-                text=char_counts,
-                textposition='auto',
-            )
-        ])
-        fig_chars.update_layout(
-            title="Character Count by Platform",
-            xaxis_title="Platform",
-            yaxis_title="Characters",
-            showlegend=False
+        st.plotly_chart(
+            bar_figure(platforms, char_counts, colors, "Character Count by Platform", "Characters"),
+            use_container_width=True,
+            config=STATIC_CHART_CONFIG
         )
-        st.plotly_chart(fig_chars, use_container_width=True)
         
         # Hashtag usage
-        fig_hashtags = go.Figure(data=[
-            go.Bar(
-                x=platforms,
-                y=hashtag_counts,
-                marker_color=[get_platform_color(p) for p in platforms],
-                text=hashtag_counts,
-                textposition='auto',
-            )
-        ])
-        fig_hashtags.update_layout(
-            title="Hashtag Usage by Platform",
-            xaxis_title="Platform", 
-            yaxis_title="Number of Hashtags",
-            showlegend=False
+        st.plotly_chart(
+            bar_figure(platforms, hashtag_counts, colors, "Hashtag Usage by Platform", "Number of Hashtags"),
+            use_container_width=True,
+            config=STATIC_CHART_CONFIG
         )
-        st.plotly_chart(fig_hashtags, use_container_width=True)
     
     with col2:
         # Word count comparison
-        fig_words = go.Figure(data=[
-            go.Bar(
-                x=platforms,
-                y=word_counts,
-                marker_color=[get_platform_color(p) for p in platforms],
-                text=word_counts,
-                textposition='auto',
-            )
-        ])
-        fig_words.update_layout(
-            title="Word Count by Platform",
-            xaxis_title="Platform",
-            yaxis_title="Words",
-            showlegend=False
+        st.plotly_chart(
+            bar_figure(platforms, word_counts, colors, "Word Count by Platform", "Words"),
+            use_container_width=True,
+            config=STATIC_CHART_CONFIG
         )
-        st.plotly_chart(fig_words, use_container_width=True)
         
         # Engagement potential pie chart
-        engagement_counts = pd.Series(engagement_scores).value_counts()
-        fig_engagement = px.pie(
-            values=engagement_counts.values,
-            names=engagement_counts.index,
-            title="Engagement Potential Distribution"
-        )
-        st.plotly_chart(fig_engagement, use_container_width=True)
+        st.plotly_chart(engagement_figure(engagement_scores), use_container_width=True)
 
-async def generate_posts_async(blog_content: str, selected_platforms: List[str]):
-    """Async wrapper for post generation"""
-    return await st.session_state.generator.generate_posts(blog_content, selected_platforms)
 
 def main():
     """Main Streamlit application"""
     
     # Header
-    st.markdown("""
-    <div class="main-header">
-        <h1>🚀 Social Media Content Generator</h1>
-        <p>Transform your blog articles into platform-optimized social media posts using AI</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.title("🚀 Social Media Content Generator")
+    st.caption("Transform your blog articles into platform-optimized social media posts using AI")
     
     # Sidebar
     with st.sidebar:
@@ -344,8 +357,8 @@ def main():
             help="Enter your OpenAI API key for real LLM generation. Leave empty for demo mode."
         )
         
+        get_generator(api_key)
         if api_key:
-            st.session_state.generator = SocialMediaGenerator(api_key)
             st.success("✅ API Key configured!")
         else:
             st.info("ℹ️ Running in demo mode with simulated responses")
@@ -354,12 +367,12 @@ def main():
         
         # Platform selection
         st.subheader("🎯 Target Platforms")
-        platform_manager = PlatformManager()
+        platform_manager = get_platform_manager()
         all_platforms = platform_manager.get_all_platforms()
         
         platform_selection = {}
         for platform in all_platforms:
-            icon = get_platform_icon(platform)
+            icon = PLATFORM_ICONS.get(platform, '📱')
             config = platform_manager.get_platform_config(platform)
             platform_selection[platform] = st.checkbox(
                 f"{icon} {config.name}",
@@ -373,15 +386,19 @@ def main():
         
         # Platform info
         st.subheader("📋 Platform Requirements")
-        for platform in selected_platforms:
-            config = platform_manager.get_platform_config(platform)
-            icon = get_platform_icon(platform)
-            st.markdown(f"""
-            **{icon} {config.name}**
-            - Max: {config.max_length:,} chars
-            - Hashtags: {config.optimal_hashtags[0]}-{config.optimal_hashtags[1]}
-            - Tone: {config.tone}
-            """)
+        if selected_platforms:
+            configs = [(platform, platform_manager.get_platform_config(platform)) for platform in selected_platforms]
+            st.dataframe(
+                {
+                    "Platform": [f"{PLATFORM_ICONS.get(p, '📱')} {c.name}" for p, c in configs],
+                    "Max Chars": [c.max_length for _, c in configs],
+                    "Hashtags": [f"{c.optimal_hashtags[0]}-{c.optimal_hashtags[1]}" for _, c in configs],
+                    "Tone": [c.tone for _, c in configs]
+                },
+                column_config={"Max Chars": st.column_config.NumberColumn(format="localized")},
+                hide_index=True,
+                use_container_width=True
+            )
     
     # Main content area
     tab1, tab2, tab3 = st.tabs(["📝 Content Input", "🎯 Generated Posts", "📊 Analytics"])
@@ -396,38 +413,16 @@ def main():
                 st.session_state.sample_loaded = True
         
         # Blog content input
-        sample_content = """# The Future of Remote Work: 5 Trends Reshaping the Workplace
-
-The pandemic accelerated remote work adoption, but what we're seeing now goes far beyond emergency measures. Companies and employees alike are reimagining what work means in the digital age.
-
-## 1. Hybrid Models Become the Norm
-Organizations are discovering that flexibility isn't just a perk—it's a competitive advantage. The best talent expects options, and companies that offer them are winning the recruitment game.
-
-## 2. Digital-First Company Culture
-Remote-first companies are building stronger cultures than ever by being intentional about connection. Virtual coffee chats, online team building, and digital collaboration tools are creating bonds that transcend physical spaces.
-
-## 3. Results-Oriented Performance Metrics
-The shift from hours worked to outcomes achieved is revolutionizing how we measure success. Companies are focusing on deliverables, impact, and innovation rather than desk time.
-
-## 4. Investment in Home Office Infrastructure
-Employers are recognizing that a productive remote workforce requires proper tools. From ergonomic chairs to high-speed internet stipends, companies are investing in their distributed teams.
-
-## 5. Mental Health and Work-Life Balance Priority
-The conversation around burnout has reached a tipping point. Organizations are implementing wellness programs, mental health days, and boundaries that actually protect personal time.
-
-The future of work isn't about choosing between remote and in-office—it's about creating systems that empower people to do their best work wherever they are."""
-        
         blog_content = st.text_area(
             "Paste your blog article content here:",
             height=400,
-            value=sample_content if st.session_state.get('sample_loaded', False) else "",
+            value=SAMPLE_CONTENT if st.session_state.get('sample_loaded', False) else "",
             placeholder="Enter your blog article content..."
         )
         
         # Content stats
         if blog_content:
-            word_count = len(blog_content.split())
-            char_count = len(blog_content)
+            word_count, char_count, lines = content_stats(blog_content)
             
             col1, col2, col3 = st.columns(3)
             with col1:
@@ -435,7 +430,6 @@ The future of work isn't about choosing between remote and in-office—it's abou
             with col2:
                 st.metric("Characters", f"{char_count:,}")
             with col3:
-                lines = len([line for line in blog_content.split('\n') if line.strip()])
                 st.metric("Lines", lines)
         
         # Generate button
@@ -443,7 +437,13 @@ The future of work isn't about choosing between remote and in-office—it's abou
         
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            if st.button("🚀 Generate Social Media Posts", type="primary", use_container_width=True):
+            generate = st.button("🚀 Generate Social Media Posts", type="primary", use_container_width=True)
+            regenerate = st.button(
+                "🔄 Regenerate Posts",
+                help="Discard this article's previously generated posts and ask the LLM again",
+                use_container_width=True
+            )
+            if generate or regenerate:
                 if not blog_content.strip():
                     st.error("⚠️ Please enter blog content first!")
                 elif not selected_platforms:
@@ -451,23 +451,29 @@ The future of work isn't about choosing between remote and in-office—it's abou
                 else:
                     with st.spinner("🔄 Analyzing content and generating posts..."):
                         # Analyze content first
-                        analyzer = ContentAnalyzer()
-                        st.session_state.blog_analysis = analyzer.analyze_blog_content(blog_content)
+                        st.session_state.blog_analysis = analyze_blog(blog_content)
                         
                         # Generate posts
                         try:
-                            # Since we can't use async in Streamlit directly, we'll use the sync version
-                            # In a real app, you'd use st.experimental_rerun or similar
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            posts = loop.run_until_complete(
-                                st.session_state.generator.generate_posts(blog_content, selected_platforms)
-                            )
-                            loop.close()
+                            generator = st.session_state.generator
+                            if regenerate:
+                                generator.invalidate(generator.blog_hash(blog_content))
+                            
+                            # The generator caches successful posts per (blog, platform) itself,
+                            # so reruns only call the LLM for platforms that are missing or failed
+                            posts = asyncio.run(stream_posts(
+                                generator,
+                                blog_content,
+                                selected_platforms
+                            ))
                             
                             st.session_state.generated_posts = posts
-                            st.success(f"✅ Generated {len(posts)} social media posts!")
-                            st.balloons()
+                            failed = [p for p in selected_platforms if p not in posts]
+                            if failed:
+                                st.warning(f"⚠️ Could not generate posts for: {', '.join(p.title() for p in failed)}")
+                            if posts:
+                                st.success(f"✅ Generated {len(posts)} social media posts!")
+                                st.balloons()
                             
                         except Exception as e:
                             st.error(f"❌ Error generating posts: {str(e)}")
@@ -485,22 +491,19 @@ The future of work isn't about choosing between remote and in-office—it's abou
             col1, col2 = st.columns([3, 1])
             with col2:
                 if st.button("📥 Export All Posts"):
+                    now = datetime.now()
+                    # orjson serializes the dataclasses natively, no intermediate dicts needed
                     export_data = {
-                        'generated_at': datetime.now().isoformat(),
-                        'blog_analysis': st.session_state.blog_analysis.__dict__ if st.session_state.blog_analysis else None,
-                        'posts': {k: {
-                            'platform': v.platform,
-                            'content': v.content,
-                            'metrics': v.metrics.__dict__,
-                            'timestamp': v.timestamp
-                        } for k, v in st.session_state.generated_posts.items()}
+                        'generated_at': now.isoformat(),
+                        'blog_analysis': st.session_state.blog_analysis,
+                        'posts': st.session_state.generated_posts
                     }
                     
-                    json_str = json.dumps(export_data, indent=2, ensure_ascii=False)
+                    json_str = orjson.dumps(export_data, option=orjson.OPT_INDENT_2).decode("utf-8")
                     st.download_button(
                         label="📁 Download JSON",
                         data=json_str,
-                        file_name=f"social_media_posts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                        file_name=f"social_media_posts_{now.strftime('%Y%m%d_%H%M%S')}.json",
                         mime="application/json"
                     )
             
@@ -528,51 +531,46 @@ The future of work isn't about choosing between remote and in-office—it's abou
             word_counts = {p: posts[p].metrics.word_count for p in posts}
             hashtag_counts = {p: posts[p].metrics.hashtag_count for p in posts}
             
-            best_engagement = max(posts.items(), key=lambda x: x[1].metrics.engagement_potential)
+            best_engagement = max(posts.items(), key=lambda x: ENGAGEMENT_RANK.get(x[1].metrics.engagement_potential, -1))
             most_hashtags = max(posts.items(), key=lambda x: x[1].metrics.hashtag_count)
             longest_post = max(posts.items(), key=lambda x: x[1].metrics.character_count)
             
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <h4>🏆 Best Engagement</h4>
-                    <p>{get_platform_icon(best_engagement[0])} <strong>{best_engagement[0].title()}</strong></p>
-                    <p>Potential: {best_engagement[1].metrics.engagement_potential}</p>
-                </div>
-                """, unsafe_allow_html=True)
+                with st.container(border=True):
+                    st.markdown("#### 🏆 Best Engagement")
+                    st.write(f"{PLATFORM_ICONS.get(best_engagement[0], '📱')} **{best_engagement[0].title()}**")
+                    st.write(f"Potential: {best_engagement[1].metrics.engagement_potential}")
             
             with col2:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <h4>🏷️ Most Hashtags</h4>
-                    <p>{get_platform_icon(most_hashtags[0])} <strong>{most_hashtags[0].title()}</strong></p>
-                    <p>Count: {most_hashtags[1].metrics.hashtag_count}</p>
-                </div>
-                """, unsafe_allow_html=True)
+                with st.container(border=True):
+                    st.markdown("#### 🏷️ Most Hashtags")
+                    st.write(f"{PLATFORM_ICONS.get(most_hashtags[0], '📱')} **{most_hashtags[0].title()}**")
+                    st.write(f"Count: {most_hashtags[1].metrics.hashtag_count}")
             
             with col3:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <h4>📏 Longest Content</h4>
-                    <p>{get_platform_icon(longest_post[0])} <strong>{longest_post[0].title()}</strong></p>
-                    <p>Length: {longest_post[1].metrics.character_count:,} chars</p>
-                </div>
-                """, unsafe_allow_html=True)
+                with st.container(border=True):
+                    st.markdown("#### 📏 Longest Content")
+                    st.write(f"{PLATFORM_ICONS.get(longest_post[0], '📱')} **{longest_post[0].title()}**")
+                    st.write(f"Length: {longest_post[1].metrics.character_count:,} chars")
             
             # Compliance check
             st.subheader("✅ Platform Compliance")
-            compliance_data = []
+            platform_col, char_col, max_col, ok_col = [], [], [], []
             for platform, post in posts.items():
-                compliance_data.append({
-                    'Platform': platform.title(),
-                    'Character Count': post.metrics.character_count,
-                    'Max Allowed': st.session_state.generator.platform_manager.get_platform_config(platform).max_length,
-                    'Compliant': '✅' if post.metrics.platform_compliance else '❌'
-                })
+                platform_col.append(platform.title())
+                char_col.append(post.metrics.character_count)
+                max_col.append(st.session_state.generator.platform_manager.get_platform_config(platform).max_length)
+                ok_col.append('✅' if post.metrics.platform_compliance else '❌')
             
-            compliance_df = pd.DataFrame(compliance_data)
+            import pandas as pd
+            compliance_df = pd.DataFrame({
+                'Platform': platform_col,
+                'Character Count': char_col,
+                'Max Allowed': max_col,
+                'Compliant': ok_col
+            })
             st.dataframe(compliance_df, use_container_width=True)
             
         else:
@@ -593,10 +591,11 @@ if __name__ == "__main__":
 
 # ===== requirements.txt =====
 """
-streamlit>=1.28.0
+streamlit>=1.42.0
 plotly>=5.15.0
 pandas>=2.0.0
 openai>=1.0.0
+orjson>=3.6.0
 asyncio
 aiohttp
 requests>=2.31.0
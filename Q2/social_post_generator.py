@@ -1,13 +1,35 @@
 import re
 import json
+import orjson
 import time
 import asyncio
-from typing import Dict, List, Tuple, Optional
+import functools
+import hashlib
+import itertools
+from collections import OrderedDict, deque
+from typing import Dict, Iterator, List, Tuple, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
-import openai  
+from openai import AsyncOpenAI
 import requests  
 
+# Number of past generation runs kept in SocialMediaGenerator.generation_history
+HISTORY_LIMIT = 100
+
+# Number of (blog, platform) posts kept in SocialMediaGenerator's post cache
+POST_CACHE_LIMIT = 256
+
+# Precompiled patterns used in per-line / per-post loops
+_HEADING_RE = re.compile(r'^#+\s+')
+_HEADING_SUB = re.compile(r'^#+\s*')
+_NUM_RE = re.compile(r'^\d+\.\s+')
+_NUM_SUB = re.compile(r'^\d+\.\s*')
+_BULLET_RE = re.compile(r'^[-*]\s+')
+_BULLET_SUB = re.compile(r'^[-*]\s*')
+_HASHTAG_RE = re.compile(r'#\w+')
+# Emoji blocks: misc symbols & dingbats (☀ ✨ ❤), arrows/stars (⭐), and the U+1F000-1FAFF pictographs
+_EMOJI_RE = re.compile('[\u2600-\u27bf\u2b00-\u2bff\U0001f000-\U0001faff]')
+
 @dataclass
 class PlatformConfig:
     name: str
@@ -34,13 +56,13 @@ class GeneratedPost:
     metrics: ContentMetrics
     timestamp: str
     
-@dataclass
+@dataclass(frozen=True)
 class BlogAnalysis:
-    """Analysis results from blog content"""
+    """Analysis results from blog content (hashable, so prompts can be memoized on it)"""
     title: str
-    key_points: List[str]
+    key_points: Tuple[str, ...]
     word_count: int
-    main_topics: List[str]
+    main_topics: Tuple[str, ...]
     tone: str
     target_audience: str
 
@@ -97,37 +119,81 @@ class PlatformManager:
     def get_all_platforms(self) -> List[str]:
         return list(self.platforms.keys())
 
+# ===== Keyword tables =====
+# Common business/tech topics
+TOPIC_KEYWORDS = {
+    'technology': frozenset(['tech', 'digital', 'AI', 'software', 'data', 'automation']),
+    'business': frozenset(['business', 'strategy', 'growth', 'revenue', 'market']),
+    'productivity': frozenset(['productivity', 'efficiency', 'workflow', 'optimization']),
+    'remote work': frozenset(['remote', 'work from home', 'distributed', 'virtual']),
+    'marketing': frozenset(['marketing', 'brand', 'customer', 'audience', 'campaign'])
+}
+
+# Checked in order; the first category with a hit wins
+TONE_KEYWORDS = (
+    ('enthusiastic', frozenset(['exciting', 'amazing', 'incredible', '!'])),
+    ('professional', frozenset(['professional', 'industry', 'strategic'])),
+    ('educational', frozenset(['tips', 'how to', 'guide', 'tutorial'])),
+)
+
+AUDIENCE_KEYWORDS = (
+    ('professionals', frozenset(['business', 'professional', 'enterprise'])),
+    ('entrepreneurs', frozenset(['startup', 'entrepreneur', 'founder'])),
+    ('developers', frozenset(['developer', 'code', 'programming'])),
+)
+
+# Call-to-action phrases that raise engagement potential
+CTA_PHRASES = ('comment', 'share', 'like', 'what do you think', 'let me know', 'drop', 'tag')
+
+# Keyword-presence metrics per platform: metric name -> keywords that set it
+PLATFORM_METRIC_KEYWORDS = {
+    'linkedin': {
+        'professional_tone': frozenset(['professional', 'industry', 'business', 'strategy']),
+        'thought_leadership': frozenset(['insight', 'trend', 'future', 'innovation'])
+    },
+    'instagram': {
+        'visual_language': frozenset(['see', 'look', 'visual', 'image', 'picture'])
+    },
+    'facebook': {
+        'share_potential': frozenset(['share', 'spread', 'tell others'])
+    },
+    'tiktok': {
+        'trend_potential': frozenset(['trending', 'viral', 'challenge', 'pov']),
+        'youth_appeal': frozenset(['bestie', 'no cap', 'fr', 'periodt'])
+    }
+}
+
 class ContentAnalyzer:
     """Analyzes blog content to extract key information"""
     
     def analyze_blog_content(self, content: str) -> BlogAnalysis:
         """Extract key information from blog content"""
         lines = [line.strip() for line in content.split('\n') if line.strip()]
+        content_lower = content.lower()
         
         # Extract title (first heading or first line)
         title = self._extract_title(lines)
         
-        # Extract key points (headings, bullet points)
-        key_points = self._extract_key_points(lines)
+        # Extract key points (headings, bullet points); stops scanning after the top 5
+        key_points = tuple(itertools.islice(self._extract_key_points(lines), 5))
         
         # Basic metrics
-        words = content.split()
-        word_count = len(words)
+        word_count = len(content.split())
         
         # Extract main topics (simplified - could use NLP libraries)
-        main_topics = self._extract_topics(content)
+        main_topics = self._extract_topics(content_lower)
         
         # Analyze tone (simplified)
-        tone = self._analyze_tone(content)
+        tone = self._analyze_tone(content_lower)
         
         # Determine target audience (simplified)
-        target_audience = self._determine_audience(content)
+        target_audience = self._determine_audience(content_lower)
         
         return BlogAnalysis(
             title=title,
-            key_points=key_points[:5],  # Top 5 key points
+            key_points=key_points,
             word_count=word_count,
-            main_topics=main_topics,
+            main_topics=tuple(main_topics),
             tone=tone,
             target_audience=target_audience
         )
@@ -136,80 +202,65 @@ class ContentAnalyzer:
         """Extract title from content"""
         for line in lines:
             if line.startswith('#'):
-                return re.sub(r'^#+\s*', '', line)
+                return _HEADING_SUB.sub('', line)
         return lines[0] if lines else "Blog Post"
     
-    def _extract_key_points(self, lines: List[str]) -> List[str]:
-        """Extract key points from headings and structure"""
-        key_points = []
-        
+    def _extract_key_points(self, lines: List[str]) -> Iterator[str]:
+        """Yield key points from headings and structure"""
         for line in lines:
             # Headings
-            if re.match(r'^#+\s+', line):
-                key_points.append(re.sub(r'^#+\s*', '', line))
+            if _HEADING_RE.match(line):
+                yield _HEADING_SUB.sub('', line)
             # Numbered points
-            elif re.match(r'^\d+\.\s+', line):
-                key_points.append(re.sub(r'^\d+\.\s*', '', line))
+            elif _NUM_RE.match(line):
+                yield _NUM_SUB.sub('', line)
             # Bullet points
-            elif re.match(r'^[-*]\s+', line):
-                key_points.append(re.sub(r'^[-*]\s*', '', line))
-        
-        return key_points
+            elif _BULLET_RE.match(line):
+                yield _BULLET_SUB.sub('', line)
     
-    def _extract_topics(self, content: str) -> List[str]:
+    def _extract_topics(self, content_lower: str) -> List[str]:
         """Simple topic extraction (could be enhanced with NLP)"""
-        # Common business/tech topics
-        topic_keywords = {
-            'technology': ['tech', 'digital', 'AI', 'software', 'data', 'automation'],
-            'business': ['business', 'strategy', 'growth', 'revenue', 'market'],
-            'productivity': ['productivity', 'efficiency', 'workflow', 'optimization'],
-            'remote work': ['remote', 'work from home', 'distributed', 'virtual'],
-            'marketing': ['marketing', 'brand', 'customer', 'audience', 'campaign']
-        }
-        
-        content_lower = content.lower()
-        topics = []
-        
-        for topic, keywords in topic_keywords.items():
-            if any(keyword in content_lower for keyword in keywords):
-                topics.append(topic)
+        topics = [
+            topic for topic, keywords in TOPIC_KEYWORDS.items()
+            if any(keyword in content_lower for keyword in keywords)
+        ]
         
         return topics[:3]  # Return top 3 topics
     
-    def _analyze_tone(self, content: str) -> str:
+    def _analyze_tone(self, content_lower: str) -> str:
         """Simple tone analysis"""
-        content_lower = content.lower()
-        
-        if any(word in content_lower for word in ['exciting', 'amazing', 'incredible', '!']):
-            return 'enthusiastic'
-        elif any(word in content_lower for word in ['professional', 'industry', 'strategic']):
-            return 'professional'
-        elif any(word in content_lower for word in ['tips', 'how to', 'guide', 'tutorial']):
-            return 'educational'
-        else:
-            return 'informative'
+        for tone, keywords in TONE_KEYWORDS:
+            if any(word in content_lower for word in keywords):
+                return tone
+        return 'informative'
     
-    def _determine_audience(self, content: str) -> str:
+    def _determine_audience(self, content_lower: str) -> str:
         """Determine target audience"""
-        content_lower = content.lower()
-        
-        if any(word in content_lower for word in ['business', 'professional', 'enterprise']):
-            return 'professionals'
-        elif any(word in content_lower for word in ['startup', 'entrepreneur', 'founder']):
-            return 'entrepreneurs'
-        elif any(word in content_lower for word in ['developer', 'code', 'programming']):
-            return 'developers'
-        else:
-            return 'general audience'
+        for audience, keywords in AUDIENCE_KEYWORDS:
+            if any(word in content_lower for word in keywords):
+                return audience
+        return 'general audience'
 
 class PromptEngine:
     """Generates platform-specific prompts for LLM"""
     
     def __init__(self, platform_manager: PlatformManager):
         self.platform_manager = platform_manager
+        self.platform_prompts = {
+            'twitter': self._twitter_prompt,
+            'linkedin': self._linkedin_prompt,
+            'instagram': self._instagram_prompt,
+            'facebook': self._facebook_prompt,
+            'tiktok': self._tiktok_prompt
+        }
+        # Regenerating the same blog (retries, A/B runs) reuses the already-built prompt strings
+        self._cached_prompt = functools.lru_cache(maxsize=256)(self._build_prompt)
     
     def generate_prompt(self, analysis: BlogAnalysis, platform: str) -> str:
         """Generate platform-specific prompt for LLM"""
+        return self._cached_prompt(analysis, platform)
+    
+    def _build_prompt(self, analysis: BlogAnalysis, platform: str) -> str:
         config = self.platform_manager.get_platform_config(platform)
         if not config:
             raise ValueError(f"Unknown platform: {platform}")
@@ -224,15 +275,8 @@ Blog Article Analysis:
 - Word Count: {analysis.word_count}
         """
         
-        platform_prompts = {
-            'twitter': self._twitter_prompt(config, base_context),
-            'linkedin': self._linkedin_prompt(config, base_context),
-            'instagram': self._instagram_prompt(config, base_context),
-            'facebook': self._facebook_prompt(config, base_context),
-            'tiktok': self._tiktok_prompt(config, base_context)
-        }
-        
-        return platform_prompts.get(platform, self._generic_prompt(config, base_context))
+        build = self.platform_prompts.get(platform, self._generic_prompt)
+        return build(config, base_context)
     
     def _twitter_prompt(self, config: PlatformConfig, context: str) -> str:
         return f"""{context}
@@ -319,46 +363,199 @@ Create a {config.name} post that:
 - Uses {config.optimal_hashtags[0]}-{config.optimal_hashtags[1]} relevant hashtags
 """
 
+class ResponseTooLongError(Exception):
+    """A streamed completion overshot the platform limit and was cut off"""
+
+class TokenBucket:
+    """Async token bucket that spaces requests to a sustained rate"""
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
 class LLMService:
     """Service for interacting with Language Models"""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-3.5-turbo"):
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-3.5-turbo",
+                 max_concurrency: int = 20, rpm: int = 500, simulate_latency: float = 0.0):
+        if max_concurrency <= 0:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+        if rpm <= 0:
+            raise ValueError(f"rpm must be positive, got {rpm}")
         self.api_key = api_key
         self.model = model
+        # Seconds each simulated (no API key) response waits; 0 returns immediately
+        self.simulate_latency = simulate_latency
         self.client = None
+        self.max_concurrency = max_concurrency
+        self.rpm = rpm
+        self._client_loop = None
+        self._limiter_loop = None
+        self._semaphore = None
+        self._bucket = None
+        
+    
+    def _client(self) -> Optional[AsyncOpenAI]:
+        """OpenAI client for the running event loop, or None without an API key.
+        
+        One client per loop: its pooled httpx connections are reused across calls,
+        but they belong to the loop that opened them, so a new loop gets a new client.
+        The client retries 429s itself with exponential backoff.
+        """
+        if not self.api_key:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not loop:
+            # A client left over from a finished loop can't be closed from this one (its
+            # sockets belong to the dead loop); callers should aclose() before their loop ends
+            self._client_loop = loop
+            self.client = AsyncOpenAI(api_key=self.api_key, max_retries=2, timeout=30.0)
+        return self.client
+    
+    async def aclose(self):
+        """Close the current client and its connection pool; the next call opens a fresh one"""
+        client, self.client, self._client_loop = self.client, None, None
+        if client is not None:
+            await client.close()
+    
+    def _limiters(self) -> Tuple[asyncio.Semaphore, TokenBucket]:
+        """Concurrency and rate limiters for the running event loop.
         
-        if api_key:
-            openai.api_key = api_key
-            self.client = openai
+        asyncio primitives are bound to one loop, and each Streamlit run uses a
+        fresh loop, so they are rebuilt whenever the loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._limiter_loop is not loop:
+            self._limiter_loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._bucket = TokenBucket(self.rpm / 60)
+        return self._semaphore, self._bucket
     
-    async def generate_content(self, prompt: str, max_tokens: int = 500) -> str:
+    async def generate_content(self, prompt: str, max_tokens: int = 500,
+                               max_length: Optional[int] = None) -> str:
         """Generate content using LLM (with fallback simulation)"""
-        if self.client and self.api_key:
-            return await self._call_openai_api(prompt, max_tokens)
+        if self.api_key:
+            return await self._call_openai_api(prompt, max_tokens, max_length)
         else:
             return await self._simulate_llm_response(prompt)
     
-    async def _call_openai_api(self, prompt: str, max_tokens: int) -> str:
-        """Make actual API call to OpenAI"""
-        try:
-            response = await self.client.ChatCompletion.acreate(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a social media expert specializing in platform-specific content creation."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=max_tokens,
-                temperature=0.7
+    async def _call_openai_api(self, prompt: str, max_tokens: int,
+                               max_length: Optional[int] = None) -> str:
+        """Make actual API call to OpenAI, streaming so overlong posts can be cut off early.
+        
+        Failures propagate to the caller rather than falling back to simulated text,
+        so canned demo content is never mistaken for (and cached as) a real completion.
+        A stream aborted for length raises ResponseTooLongError instead of returning the fragment.
+        """
+        semaphore, bucket = self._limiters()
+        # A post this far over the platform limit won't be usable; stop paying for more tokens
+        abort_at = int(max_length * 1.5) if max_length else None
+        async with semaphore:
+            await bucket.acquire()
+            stream = await self._client().chat.completions.create(
+                **self._chat_request_body(prompt, max_tokens), stream=True
             )
-            return response.choices[0].message.content.strip()
-        except Exception as e:
-            print(f"API call failed: {e}")
-            return await self._simulate_llm_response(prompt)
+            parts = []
+            length = 0
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content or ''
+                parts.append(delta)
+                length += len(delta)
+                if abort_at and length > abort_at:
+                    await stream.close()
+                    raise ResponseTooLongError(
+                        f"response passed {abort_at} characters (limit {max_length}); aborted"
+                    )
+        return ''.join(parts).strip()
+    
+    def _chat_request_body(self, prompt: str, max_tokens: int) -> dict:
+        """Chat completion parameters shared by online and batch requests"""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": "You are a social media expert specializing in platform-specific content creation."},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.7
+        }
+    
+    async def submit_batch(self, prompts: List[Tuple[str, str]], max_tokens: int = 500) -> str:
+        """Submit (custom_id, prompt) pairs as one OpenAI Batch API job and return the batch id"""
+        client = self._client()
+        if not client:
+            raise RuntimeError("Batch generation requires an OpenAI API key")
+        
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._chat_request_body(prompt, max_tokens)
+            }, ensure_ascii=False)
+            for custom_id, prompt in prompts
+        ]
+        batch_file = await client.files.create(
+            file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+    
+    async def await_batch(self, batch_id: str, poll_interval: float = 5.0,
+                          max_poll_interval: float = 300.0) -> Dict[str, str]:
+        """Poll a batch with exponential backoff and return {custom_id: content} for successful requests"""
+        client = self._client()
+        while True:
+            batch = await client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 2, max_poll_interval)
+        
+        results = {}
+        if not batch.output_file_id:
+            return results
+        
+        output = await client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                print(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                continue
+            results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"].strip()
+        return results
     
     async def _simulate_llm_response(self, prompt: str) -> str:
         """Simulate LLM response for testing purposes"""
-        # Add realistic delay
-        await asyncio.sleep(1 + (time.time() % 2))
+        # Optional fixed delay to mimic network latency
+        if self.simulate_latency:
+            await asyncio.sleep(self.simulate_latency)
         
         # Extract platform from prompt
         platform = self._extract_platform_from_prompt(prompt)
@@ -449,6 +646,20 @@ No cap, results > hours worked is the energy we needed all along 💯
 class ContentMetricsAnalyzer:
     """Analyzes generated content for metrics and compliance"""
     
+    # Platform metrics that are computed rather than keyword lookups
+    PLATFORM_NUMERIC_METRICS = {
+        'twitter': lambda content, content_lower, emoji_count: {
+            'thread_potential': len(content) > 200,
+            'retweet_potential': '?' in content or 'RT' in content.upper()
+        },
+        'instagram': lambda content, content_lower, emoji_count: {
+            'emoji_count': emoji_count
+        },
+        'facebook': lambda content, content_lower, emoji_count: {
+            'discussion_potential': content.count('?') + content_lower.count('what do you think')
+        }
+    }
+    
     def __init__(self, platform_manager: PlatformManager):
         self.platform_manager = platform_manager
     
@@ -459,16 +670,22 @@ class ContentMetricsAnalyzer:
         # Basic metrics
         char_count = len(content)
         word_count = len(content.split())
-        hashtag_count = len(re.findall(r'#\w+', content))
+        hashtag_count = len(_HASHTAG_RE.findall(content))
+        emoji_count = len(_EMOJI_RE.findall(content))
+        content_lower = content.lower()
         
         # Platform compliance
         compliance = char_count <= config.max_length
         
         # Engagement potential (simplified scoring)
-        engagement_score = self._calculate_engagement_potential(content, platform)
+        engagement_score = self._calculate_engagement_potential(
+            content, content_lower, platform, hashtag_count, emoji_count
+        )
         
         # Additional platform-specific metrics
-        additional_metrics = self._get_platform_specific_metrics(content, platform)
+        additional_metrics = self._get_platform_specific_metrics(
+            content, content_lower, platform, emoji_count
+        )
         
         return ContentMetrics(
             character_count=char_count,
@@ -479,25 +696,23 @@ class ContentMetricsAnalyzer:
             additional_metrics=additional_metrics
         )
     
-    def _calculate_engagement_potential(self, content: str, platform: str) -> str:
+    def _calculate_engagement_potential(
+        self, content: str, content_lower: str, platform: str, hashtag_count: int, emoji_count: int
+    ) -> str:
         """Calculate engagement potential based on content features"""
         score = 0
-        content_lower = content.lower()
         
         # Question marks increase engagement
         score += content.count('?') * 10
         
         # Call-to-action phrases
-        cta_phrases = ['comment', 'share', 'like', 'what do you think', 'let me know', 'drop', 'tag']
-        score += sum(5 for phrase in cta_phrases if phrase in content_lower)
+        score += sum(5 for phrase in CTA_PHRASES if phrase in content_lower)
         
         # Emojis (for visual platforms)
         if platform in ['instagram', 'tiktok', 'facebook']:
-            # Simplified emoji detection
-            score += len(re.findall(r'[😀-🿿]|[🌀-🗿]|[🚀-🛿]', content)) * 2
+            score += emoji_count * 2
         
         # Hashtags
-        hashtag_count = len(re.findall(r'#\w+', content))
         config = self.platform_manager.get_platform_config(platform)
         if config.optimal_hashtags[0] <= hashtag_count <= config.optimal_hashtags[1]:
             score += 15
@@ -512,42 +727,82 @@ class ContentMetricsAnalyzer:
         else:
             return "Low"
     
-    def _get_platform_specific_metrics(self, content: str, platform: str) -> Dict[str, any]:
+    def _get_platform_specific_metrics(
+        self, content: str, content_lower: str, platform: str, emoji_count: int
+    ) -> Dict[str, any]:
         """Get additional platform-specific metrics"""
-        metrics = {}
+        numeric = self.PLATFORM_NUMERIC_METRICS.get(platform)
+        metrics = numeric(content, content_lower, emoji_count) if numeric else {}
         
-        if platform == 'twitter':
-            metrics['thread_potential'] = len(content) > 200
-            metrics['retweet_potential'] = '?' in content or 'RT' in content.upper()
-        
-        elif platform == 'linkedin':
-            metrics['professional_tone'] = any(word in content.lower() for word in ['professional', 'industry', 'business', 'strategy'])
-            metrics['thought_leadership'] = any(word in content.lower() for word in ['insight', 'trend', 'future', 'innovation'])
-        
-        elif platform == 'instagram':
-            metrics['emoji_count'] = len(re.findall(r'[😀-🿿]|[🌀-🗿]|[🚀-🛿]', content))
-            metrics['visual_language'] = any(word in content.lower() for word in ['see', 'look', 'visual', 'image', 'picture'])
-        
-        elif platform == 'facebook':
-            metrics['discussion_potential'] = content.count('?') + content.lower().count('what do you think')
-            metrics['share_potential'] = any(word in content.lower() for word in ['share', 'spread', 'tell others'])
-        
-        elif platform == 'tiktok':
-            metrics['trend_potential'] = any(word in content.lower() for word in ['trending', 'viral', 'challenge', 'pov'])
-            metrics['youth_appeal'] = any(word in content.lower() for word in ['bestie', 'no cap', 'fr', 'periodt'])
+        for name, keywords in PLATFORM_METRIC_KEYWORDS.get(platform, {}).items():
+            metrics[name] = any(word in content_lower for word in keywords)
         
         return metrics
 
+def _write_json(path: str, data: dict):
+    """Write data to path as indented UTF-8 JSON"""
+    with open(path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+
 class SocialMediaGenerator:
     """Main class that orchestrates the social media content generation"""
     
-    def __init__(self, llm_api_key: Optional[str] = None):
+    def __init__(self, llm_api_key: Optional[str] = None, max_concurrency: int = 20,
+                 rpm: int = 500, simulate_latency: float = 0.0):
         self.platform_manager = PlatformManager()
         self.content_analyzer = ContentAnalyzer()
         self.prompt_engine = PromptEngine(self.platform_manager)
-        self.llm_service = LLMService(llm_api_key)
+        self.llm_service = LLMService(
+            llm_api_key,
+            max_concurrency=max_concurrency,
+            rpm=rpm,
+            simulate_latency=simulate_latency
+        )
         self.metrics_analyzer = ContentMetricsAnalyzer(self.platform_manager)
-        self.generation_history = []
+        # Most recent runs only; entries reference the post objects rather than copies
+        self.generation_history = deque(maxlen=HISTORY_LIMIT)
+        # (blog hash, platform) -> post, so re-running a blog only calls the LLM for missing platforms
+        # LRU-bounded; only compliant, real LLM completions are stored, never simulated demo text
+        self._post_cache: Dict[Tuple[str, str], GeneratedPost] = OrderedDict()
+    
+    async def aclose(self):
+        """Release the LLM client's connections; call before the event loop that used them ends"""
+        await self.llm_service.aclose()
+    
+    @staticmethod
+    def blog_hash(blog_content: str) -> str:
+        """Content hash used to key the post cache"""
+        return hashlib.blake2b(blog_content.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def invalidate(self, blog_hash: Optional[str] = None):
+        """Drop cached posts for one blog hash, or for every blog when none is given"""
+        if blog_hash is None:
+            self._post_cache.clear()
+            return
+        for key in [key for key in self._post_cache if key[0] == blog_hash]:
+            del self._post_cache[key]
+    
+    def _cached_posts(self, blog_hash: str, target_platforms: List[str]) -> Dict[str, GeneratedPost]:
+        """Previously generated posts for this blog among the requested platforms"""
+        cached = {}
+        for platform in target_platforms:
+            key = (blog_hash, platform)
+            if key in self._post_cache:
+                self._post_cache.move_to_end(key)
+                cached[platform] = self._post_cache[key]
+        return cached
+    
+    def _cache_post(self, blog_hash: str, post: GeneratedPost):
+        """Remember a post generated by the real LLM, evicting the least recently used.
+        
+        Posts over the platform limit are not kept, so generating again re-rolls them.
+        """
+        if not self.llm_service.api_key or not post.metrics.platform_compliance:
+            return
+        self._post_cache[(blog_hash, post.platform)] = post
+        self._post_cache.move_to_end((blog_hash, post.platform))
+        while len(self._post_cache) > POST_CACHE_LIMIT:
+            self._post_cache.popitem(last=False)
     
     async def generate_posts(self, blog_content: str, target_platforms: List[str] = None) -> Dict[str, GeneratedPost]:
         """Generate social media posts for specified platforms"""
@@ -557,55 +812,167 @@ class SocialMediaGenerator:
         # Analyze blog content
         analysis = self.content_analyzer.analyze_blog_content(blog_content)
         
-        # Generate posts for each platform
-        generated_posts = {}
+        blog_hash = self.blog_hash(blog_content)
+        cached = self._cached_posts(blog_hash, target_platforms)
         
-        for platform in target_platforms:
-            try:
-                # Generate platform-specific prompt
-                prompt = self.prompt_engine.generate_prompt(analysis, platform)
-                
-                # Generate content using LLM
-                content = await self.llm_service.generate_content(prompt)
-                
-                # Analyze generated content
-                metrics = self.metrics_analyzer.analyze_content(content, platform)
-                
-                # Create post object
-                post = GeneratedPost(
-                    platform=platform,
-                    content=content,
-                    metrics=metrics,
-                    timestamp=datetime.now().isoformat()
+        # Generate platform-specific prompts for the platforms not already cached
+        prompts = self._build_prompts(analysis, [p for p in target_platforms if p not in cached])
+        
+        # One timestamp for the whole run, shared by every post and the history entry
+        now_iso = datetime.now().isoformat()
+        
+        # Fan out all LLM calls concurrently; one failing platform doesn't cancel the rest
+        contents = await asyncio.gather(
+            *(
+                self.llm_service.generate_content(
+                    prompt, max_length=self.platform_manager.get_platform_config(platform).max_length
                 )
-                
-                generated_posts[platform] = post
-                
-            except Exception as e:
-                print(f"Failed to generate content for {platform}: {e}")
+                for platform, prompt in prompts.items()
+            ),
+            return_exceptions=True
+        )
+        
+        # Analyze generated content
+        fresh = {}
+        for platform, content in zip(prompts, contents):
+            if isinstance(content, Exception):
+                print(f"Failed to generate content for {platform}: {content}")
                 continue
+            fresh[platform] = self._build_post(platform, content, now_iso)
+            self._cache_post(blog_hash, fresh[platform])
         
-        # Save to history
+        # Keep the requested platform order
+        generated_posts = {
+            platform: cached[platform] if platform in cached else fresh[platform]
+            for platform in target_platforms
+            if platform in cached or platform in fresh
+        }
+        
+        self._record_history(analysis, generated_posts, now_iso)
+        
+        return generated_posts
+    
+    async def stream_posts(self, blog_content: str, target_platforms: List[str] = None):
+        """Yield (platform, post) pairs as each platform's generation completes"""
+        if target_platforms is None:
+            target_platforms = self.platform_manager.get_all_platforms()
+        
+        analysis = self.content_analyzer.analyze_blog_content(blog_content)
+        
+        blog_hash = self.blog_hash(blog_content)
+        generated_posts = self._cached_posts(blog_hash, target_platforms)
+        for platform, post in generated_posts.items():
+            yield platform, post
+        
+        prompts = self._build_prompts(analysis, [p for p in target_platforms if p not in generated_posts])
+        now_iso = datetime.now().isoformat()
+        
+        for next_done in asyncio.as_completed(
+            [self._generate_post(platform, prompt, now_iso) for platform, prompt in prompts.items()]
+        ):
+            post = await next_done
+            if post is None:
+                continue
+            generated_posts[post.platform] = post
+            self._cache_post(blog_hash, post)
+            yield post.platform, post
+        
+        self._record_history(analysis, generated_posts, now_iso)
+    
+    def _record_history(self, analysis: BlogAnalysis, generated_posts: Dict[str, GeneratedPost], now_iso: str):
+        """Save a generation run to history"""
         self.generation_history.append({
-            'timestamp': datetime.now().isoformat(),
-            'blog_analysis': asdict(analysis),
-            'generated_posts': {k: asdict(v) for k, v in generated_posts.items()}
+            'timestamp': now_iso,
+            'blog_analysis': analysis,
+            'generated_posts': generated_posts
         })
+    
+    async def generate_posts_batch(self, blogs: List[str], target_platforms: List[str] = None,
+                                   use_batch_api: bool = False) -> List[Dict[str, GeneratedPost]]:
+        """Generate posts for many blog articles.
         
-        return generated_posts
+        With ``use_batch_api`` (and an API key) every (blog, platform) prompt is
+        submitted as a single OpenAI Batch API job, which is billed at half price
+        and has its own rate limits but may take up to 24h. Otherwise each blog
+        goes through the regular online path.
+        """
+        if not (use_batch_api and self.llm_service.api_key):
+            return list(await asyncio.gather(
+                *(self.generate_posts(blog, target_platforms) for blog in blogs)
+            ))
+        
+        if target_platforms is None:
+            target_platforms = self.platform_manager.get_all_platforms()
+        
+        analyses = [self.content_analyzer.analyze_blog_content(blog) for blog in blogs]
+        prompts = [self._build_prompts(analysis, target_platforms) for analysis in analyses]
+        
+        batch_id = await self.llm_service.submit_batch([
+            (f"{i}:{platform}", prompt)
+            for i, blog_prompts in enumerate(prompts)
+            for platform, prompt in blog_prompts.items()
+        ])
+        contents = await self.llm_service.await_batch(batch_id)
+        now_iso = datetime.now().isoformat()
+        
+        results = []
+        for i, (analysis, blog_prompts) in enumerate(zip(analyses, prompts)):
+            generated_posts = {}
+            for platform in blog_prompts:
+                content = contents.get(f"{i}:{platform}")
+                if content is None:
+                    print(f"Failed to generate content for {platform} (blog {i})")
+                    continue
+                generated_posts[platform] = self._build_post(platform, content, now_iso)
+            self._record_history(analysis, generated_posts, now_iso)
+            results.append(generated_posts)
+        return results
+    
+    def _build_prompts(self, analysis: BlogAnalysis, target_platforms: List[str]) -> Dict[str, str]:
+        """Build prompts for each platform, skipping platforms that fail"""
+        prompts = {}
+        for platform in target_platforms:
+            try:
+                prompts[platform] = self.prompt_engine.generate_prompt(analysis, platform)
+            except Exception as e:
+                print(f"Failed to generate content for {platform}: {e}")
+        return prompts
     
-    def export_posts(self, posts: Dict[str, GeneratedPost], filename: str = None) -> str:
+    def _build_post(self, platform: str, content: str, timestamp: str) -> GeneratedPost:
+        """Analyze generated content and wrap it in a post object"""
+        metrics = self.metrics_analyzer.analyze_content(content, platform)
+        return GeneratedPost(
+            platform=platform,
+            content=content,
+            metrics=metrics,
+            timestamp=timestamp
+        )
+    
+    async def _generate_post(self, platform: str, prompt: str, timestamp: str) -> Optional[GeneratedPost]:
+        """Generate a single platform post, returning None on failure"""
+        try:
+            content = await self.llm_service.generate_content(
+                prompt, max_length=self.platform_manager.get_platform_config(platform).max_length
+            )
+            return self._build_post(platform, content, timestamp)
+        except Exception as e:
+            print(f"Failed to generate content for {platform}: {e}")
+            return None
+    
+    async def export_posts(self, posts: Dict[str, GeneratedPost], filename: str = None) -> str:
         """Export generated posts to JSON file"""
+        now = datetime.now()
         if filename is None:
-            filename = f"social_media_posts_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            filename = f"social_media_posts_{now.strftime('%Y%m%d_%H%M%S')}.json"
         
         export_data = {
-            'generated_at': datetime.now().isoformat(),
-            'posts': {k: asdict(v) for k, v in posts.items()}
+            'generated_at': now.isoformat(),
+            # orjson serializes the dataclasses natively
+            'posts': posts
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        # Serialize and write off the event loop so in-flight generations keep running
+        await asyncio.to_thread(_write_json, filename, export_data)
         
         return filename
     
@@ -663,8 +1030,10 @@ The future of work isn't about choosing between remote and in-office—it's abou
             print(f"- Additional: {post.metrics.additional_metrics}")
     
     # Export results
-    filename = generator.export_posts(posts)
+    filename = await generator.export_posts(posts)
     print(f"\nResults exported to: {filename}")
+    
+    await generator.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file